@@ -14,13 +14,24 @@ To add more manuscripts:
   Add that number to the MANUSCRIPT_IDS list below.
 """
 
-import json
-import time
+import asyncio
+import email.utils
+import io
+import multiprocessing
+import os
+import random
 import re
 import sys
-import requests
-from bs4 import BeautifulSoup
+import aiohttp
+import ahocorasick
+import orjson
+from aiohttp_client_cache import CachedSession, SQLiteBackend
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta, timezone
+from lxml import etree
+from lxml.cssselect import CSSSelector
 from pathlib import Path
+from typing import Iterator
 
 # ──────────────────────────────────────────────────────────────────────────────
 # CONFIGURATION — edit these to add manuscripts
@@ -40,6 +51,8 @@ MANUSCRIPT_IDS = [
 # Keywords used to identify which saints' Lives appear in each manuscript.
 # Keys must match the saint page filenames in docs/saints/ (without .html).
 # Values are lists of substrings to search for in work titles (case-insensitive).
+# Empty strings are ignored rather than matching every title, so a saint with
+# no non-empty keywords is never identified.
 SAINT_KEYWORDS = {
     "saint-martin":    ["martin"],
     "saint-catherine": ["catherine", "katherina"],
@@ -60,63 +73,152 @@ HEADERS = {
     "Accept-Language": "fr-FR,fr;q=0.9,en;q=0.8",
 }
 
-# Seconds to wait between requests (be polite to Jonas servers)
-DELAY_SECONDS = 2.5
+# Jonas pages are cached on disk so re-runs do not download them again
+CACHE_PATH = Path(__file__).parent / ".jonas_cache.sqlite"
+CACHE_EXPIRE_AFTER = timedelta(days=7)
+
+# How many manuscripts may be in flight at once, and how many connections
+# may be open to the Jonas host at the same time (be polite to Jonas servers)
+MAX_CONCURRENT_REQUESTS = 8
+MAX_CONNECTIONS_PER_HOST = 4
+
+# Seconds before a single request is abandoned
+REQUEST_TIMEOUT = 30
+
+# Transient failures are retried with exponential backoff and random jitter:
+# waits RETRY_BACKOFF × 1, 2, 4 … seconds between attempts, or as long as the
+# server's Retry-After header asks
+RETRY_TOTAL = 5
+RETRY_BACKOFF = 1.5
+
+# Longest Retry-After (seconds) we are willing to wait; asked for more, we give up
+RETRY_AFTER_MAX = 60
+RETRY_STATUSES = {429, 500, 502, 503, 504}
 
 
 # ──────────────────────────────────────────────────────────────────────────────
 # PARSING HELPERS
 # ──────────────────────────────────────────────────────────────────────────────
 
-def get_field(soup: BeautifulSoup, label: str) -> str:
+# Patterns are compiled once at import rather than on every call
+_OEUVRE_ID_RE   = re.compile(r"oeuvre=(\d+)")
+_FOLIO_RE       = re.compile(
+    r"f(?:f)?\.?\s*(\d+\s*[rv]?[ab]?)\s*[-–—]\s*(?:f(?:f)?\.?\s*)?(\d+\s*[rv]?[ab]?)",
+    re.IGNORECASE,
+)
+_NUM_RE         = re.compile(r"\d+")
+_CENTURY_RE     = re.compile(r"(\d+e\s*s\.?)")
+
+# A work's link inside its container (detail_oeuvre.php, not recherche_oeuvre.php)
+_WORK_LINK_SEL = CSSSelector("a[href*='/consulter/oeuvre/detail_oeuvre.php']")
+
+# Value cell next to a label cell
+_NEXT_DD_XP = etree.XPath("following-sibling::dd[1]")
+_NEXT_TD_XP = etree.XPath("following-sibling::td[1]")
+
+# Visible text nodes of a subtree (comments are not text nodes in lxml)
+_TEXT_XP = etree.XPath(".//text()[not(parent::script or parent::style)]")
+
+
+def _text_pieces(el: etree._Element) -> tuple:
+    """Return the non-empty, stripped text pieces of an element."""
+    pieces = (s.strip() for s in _TEXT_XP(el))
+    return tuple(p for p in pieces if p)
+
+
+def _cached_text_pieces(el: etree._Element, cache: dict) -> tuple:
     """
-    Search for 'label' in <dt> or <th> elements and return the adjacent value.
-    Uses <dd> (for dt) or the next <td> (for th) as the value container.
-    Falls back to searching in any element whose text matches, then grabbing
-    the next sibling's text.
-    Returns empty string if not found.
+    Like _text_pieces, but each node's text is extracted only once per cache.
+    A cell that is read as a value and then as a label is only walked once.
     """
-    label_lower = label.lower()
+    pieces = cache.get(el)
+    if pieces is None:
+        pieces = cache[el] = _text_pieces(el)
+    return pieces
+
 
-    # Strategy 1: dt/dd structure
-    for dt in soup.find_all("dt"):
-        if label_lower in dt.get_text(strip=True).lower():
-            dd = dt.find_next_sibling("dd")
-            if dd:
-                return dd.get_text(separator=" ", strip=True)
-
-    # Strategy 2: table th/td structure
-    for th in soup.find_all("th"):
-        if label_lower in th.get_text(strip=True).lower():
-            td = th.find_next_sibling("td")
-            if td:
-                return td.get_text(separator=" ", strip=True)
-
-    # Strategy 3: td/td (some Jonas tables use td for both label and value)
-    for td in soup.find_all("td"):
-        text = td.get_text(strip=True)
-        if label_lower in text.lower() and len(text) < 80:
-            sibling = td.find_next_sibling("td")
-            if sibling:
-                val = sibling.get_text(separator=" ", strip=True)
-                if val:
-                    return val
+def get_text(el: etree._Element, separator: str = "") -> str:
+    """
+    Return the stripped text pieces of an element joined by 'separator',
+    like BeautifulSoup's get_text(separator, strip=True).
+    """
+    return separator.join(_text_pieces(el))
+
+
+def _build_field_index(tree: etree._Element) -> dict[str, str]:
+    """
+    Walk the page once and map every lowercased label to its adjacent value.
+    Labels come from <dt> (value in the next <dd>), <th> (value in the next
+    <td>) or a short <td> (value in the next non-empty <td>). Keys are
+    ordered dt before th before td, each in document order, and the first
+    occurrence of a label wins — the same precedence get_field searches in.
+    """
+    by_tag = {"dt": {}, "th": {}, "td": {}}
+    texts = {}
+
+    for node in tree.iter("dt", "th", "td"):
+        label = "".join(_cached_text_pieces(node, texts))
+        key = label.lower()
+        fields = by_tag[node.tag]
+        if key in fields:
+            continue
 
+        if node.tag == "dt":
+            value_node = _NEXT_DD_XP(node)
+        else:
+            value_node = _NEXT_TD_XP(node)
+        if not value_node:
+            continue
+        value = " ".join(_cached_text_pieces(value_node[0], texts))
+
+        # Strategy 3: td/td (some Jonas tables use td for both label and value)
+        if node.tag == "td" and (len(label) >= 80 or not value):
+            continue
+        fields[key] = value
+
+    index = {}
+    for fields in by_tag.values():
+        for key, value in fields.items():
+            index.setdefault(key, value)
+    return index
+
+
+def get_field(index: dict, label: str) -> str:
+    """
+    Return the value of the first indexed label containing 'label'
+    (case-insensitive), searching <dt>, then <th>, then <td> labels.
+    Returns empty string if not found.
+    """
+    label_lower = label.lower()
+    for key, value in index.items():
+        if label_lower in key:
+            return value
     return ""
 
 
-def parse_shelfmark(soup: BeautifulSoup) -> str:
+def parse_shelfmark(tree: etree._Element) -> str:
     """Extract the manuscript's full shelfmark from the first <h1>."""
-    h1 = soup.find("h1")
-    if h1:
-        return h1.get_text(separator=" ", strip=True)
+    h1 = tree.find(".//h1")
+    if h1 is not None:
+        return get_text(h1, " ")
     # Fallback: try <title>
-    title = soup.find("title")
-    if title:
-        return title.get_text(strip=True)
+    title = tree.find(".//title")
+    if title is not None:
+        return get_text(title)
     return ""
 
 
+def format_dimensions(height: str, width: str) -> str:
+    """
+    Format page height and width as 'H × W mm', keeping just the numeric part
+    of each value (Jonas may append units or labels).
+    Returns empty string unless both contain a number.
+    """
+    h = _NUM_RE.search(height)
+    w = _NUM_RE.search(width)
+    return f"{h.group()} × {w.group()} mm" if h and w else ""
+
+
 def clean_title(raw_title: str) -> dict:
     """
     Jonas work titles are formatted as: 'Author|Title|Incipit référence de l'oeuvre: ...'
@@ -132,207 +234,331 @@ def clean_title(raw_title: str) -> dict:
     return {"author": "", "title": raw_title}
 
 
-def parse_contents(soup: BeautifulSoup) -> list:
+def _work_field(label: str):
     """
-    Parse the Contenu (Contents) section.
-    Jonas lists each work in a <div class='temoin'> containing an <a> link
-    pointing to /consulter/oeuvre/detail_oeuvre.php?oeuvre=...
-    Returns a list of work dicts.
+    Map a lowercased work metadata label to (work field, max value length).
+    Returns None if the cell is not a label parse_temoin reads.
     """
-    contents = []
-    seen_ids = set()
-
-    # Work entries live in divs with class "temoin"
-    # Link href matches detail_oeuvre.php (not recherche_oeuvre.php)
-    work_links = soup.find_all(
-        "a",
-        href=re.compile(r"/consulter/oeuvre/detail_oeuvre\.php")
-    )
+    label_len = len(label)
+    if "folio" in label and label_len < 40:
+        return "folio", 100
+    if "datation" in label or ("date" in label and "tation" in label):
+        return "date", 100
+    if label_len < 50:
+        if label.startswith("incipit"):
+            return "incipit", 400
+        if label.startswith("explicit"):
+            return "explicit", 400
+    return None
+
+
+def parse_temoin(container: etree._Element):
+    """
+    Parse one work entry: a <div class='temoin'> containing an <a> link
+    pointing to /consulter/oeuvre/detail_oeuvre.php?oeuvre=... and the td
+    pairs for its metadata.
+    Returns a work dict, or None if the div holds no work link.
+    """
+    links = _WORK_LINK_SEL(container)
+    if not links:
+        return None
+    link = links[0]
+    # Only the oeuvre ID is read from the (relative) href; the URL we emit is
+    # rebuilt from it, so the ../../ prefixes need no resolving
+    oeuvre_id_match = _OEUVRE_ID_RE.search(link.get("href", ""))
+    if not oeuvre_id_match:
+        return None
+    oeuvre_id = oeuvre_id_match.group(1)
+
+    raw_title = get_text(link)
+    title_parts = clean_title(raw_title)
+
+    work = {
+        "author":           title_parts["author"],
+        "title":            title_parts["title"],
+        "raw_title":        raw_title,
+        "jonas_oeuvre_url": f"https://jonas.irht.cnrs.fr/consulter/oeuvre/detail_oeuvre.php?oeuvre={oeuvre_id}",
+        "folio":            "",
+        "date":             "",
+        "incipit":          "",
+        "explicit":         "",
+    }
 
-    for link in work_links:
-        href = link.get("href", "")
-        if not href:
+    # Extract folio range: look for td pairs within the container
+    texts = {}
+    for td in container.iter("td"):
+        td_text = "".join(_cached_text_pieces(td, texts)).lower()
+        spec = _work_field(td_text)
+        if spec is None:
             continue
+        field, max_value_len = spec
 
-        # Resolve relative URL (Jonas uses ../../ prefixes)
-        if href.startswith("../../"):
-            href = href[5:]  # remove one level → /consulter/...
-        elif href.startswith(".."):
-            href = href.lstrip(".")
+        next_td = _NEXT_TD_XP(td)
+        if next_td:
+            value = " ".join(_cached_text_pieces(next_td[0], texts))
+            work[field] = value[:max_value_len]
 
-        # Deduplicate by oeuvre ID
-        oeuvre_id_match = re.search(r"oeuvre=(\d+)", href)
-        if not oeuvre_id_match:
+    # Fallback: regex for folio patterns in full container text, which is
+    # only built when no folio td was found
+    if not work["folio"]:
+        container_text = get_text(container, " ")
+        folio_match = _FOLIO_RE.search(container_text)
+        if folio_match:
+            work["folio"] = folio_match.group(0).strip()
+
+    return work
+
+
+def parse_contents(context: etree.iterparse) -> Iterator[dict]:
+    """
+    Parse the Contenu (Contents) section while the page is being parsed.
+    'context' is an iterparse over the page's <div> end events: each
+    <div class='temoin'> is turned into a work as soon as it is complete,
+    then cleared so its subtree does not stay in memory.
+    Yields work dicts, deduplicated by oeuvre URL.
+    """
+    seen_urls = set()
+
+    for _, div in context:
+        if "temoin" not in (div.get("class") or "").split():
             continue
-        oeuvre_id = oeuvre_id_match.group(1)
-        if oeuvre_id in seen_ids:
+        work = parse_temoin(div)
+        div.clear(keep_tail=True)
+
+        if work is None or work["jonas_oeuvre_url"] in seen_urls:
             continue
-        seen_ids.add(oeuvre_id)
-
-        raw_title = link.get_text(strip=True)
-        title_parts = clean_title(raw_title)
-
-        work = {
-            "author":           title_parts["author"],
-            "title":            title_parts["title"],
-            "raw_title":        raw_title,
-            "jonas_oeuvre_url": "https://jonas.irht.cnrs.fr/consulter/oeuvre/detail_oeuvre.php?oeuvre=" + oeuvre_id,
-            "folio":            "",
-            "date":             "",
-            "incipit":          "",
-            "explicit":         "",
-        }
-
-        # The container div has class "temoin" and contains td pairs for metadata
-        container = link.parent
-        for _ in range(6):
-            if container is None:
-                break
-            if container.name == "div" and "temoin" in (container.get("class") or []):
-                break
-            container = container.parent
-
-        if container:
-            container_text = container.get_text(" ", strip=True)
-
-            # Extract folio range: look for td pairs within the container
-            for td in container.find_all("td"):
-                td_text = td.get_text(strip=True).lower()
-                next_td = td.find_next_sibling("td")
-                if not next_td:
-                    continue
-                next_val = next_td.get_text(separator=" ", strip=True)
-
-                if "folio" in td_text and len(td_text) < 40:
-                    work["folio"] = next_val[:100]
-                elif "datation" in td_text or ("date" in td_text and "tation" in td_text):
-                    work["date"] = next_val[:100]
-                elif td_text.startswith("incipit") and len(td_text) < 50:
-                    work["incipit"] = next_val[:400]
-                elif td_text.startswith("explicit") and len(td_text) < 50:
-                    work["explicit"] = next_val[:400]
-
-            # Fallback: regex for folio patterns in full container text
-            if not work["folio"]:
-                folio_match = re.search(
-                    r"f(?:f)?\.?\s*(\d+\s*[rv]?[ab]?)\s*[-–—]\s*(?:f(?:f)?\.?\s*)?(\d+\s*[rv]?[ab]?)",
-                    container_text,
-                    re.IGNORECASE,
-                )
-                if folio_match:
-                    work["folio"] = folio_match.group(0).strip()
-
-        contents.append(work)
-
-    return contents
+        seen_urls.add(work["jonas_oeuvre_url"])
+        yield work
+
+
+def _build_saint_automaton(saint_keywords: dict):
+    """
+    Load every (already lowercased) saint keyword into one Aho–Corasick
+    automaton, so a title is scanned once for all saints at the same time.
+    Each keyword maps to a tuple of saint IDs, since several saints may
+    share one keyword.
+    """
+    automaton = ahocorasick.Automaton()
+    for saint_id, keywords in saint_keywords.items():
+        for kw in keywords:
+            if not kw:
+                continue
+            saint_ids = automaton.get(kw, ())
+            if saint_id not in saint_ids:
+                automaton.add_word(kw, saint_ids + (saint_id,))
+    automaton.make_automaton()
+    return automaton
+
+
+# Automata already built, keyed by their lowercased keyword mapping
+_SAINT_AUTOMATA = {}
+
+
+def _saint_automaton(saint_keywords: dict):
+    """
+    Return the automaton for a keyword mapping, building it on first use.
+    Keywords are lowercased here, once per call, never once per title.
+    """
+    key = tuple(
+        (saint_id, tuple(kw.lower() for kw in keywords))
+        for saint_id, keywords in saint_keywords.items()
+    )
+    automaton = _SAINT_AUTOMATA.get(key)
+    if automaton is None:
+        automaton = _SAINT_AUTOMATA[key] = _build_saint_automaton(dict(key))
+    return automaton
+
+
+# Build the automaton for the configured saints at import
+_saint_automaton(SAINT_KEYWORDS)
 
 
 def identify_saints(contents: list, saint_keywords: dict) -> list:
     """
-    Return list of saint IDs whose keywords appear in any work title.
+    Return list of saint IDs whose keywords appear in any work title,
+    in order of first appearance (saint_keywords order within one title).
     """
-    found = []
+    automaton = _saint_automaton(saint_keywords)
+    # No keywords to look for (an automaton with no words cannot be scanned)
+    if len(automaton) == 0:
+        return []
+    found = {}  # used as an ordered set
     for work in contents:
-        title_lower = work["title"].lower()
-        for saint_id, keywords in saint_keywords.items():
-            if saint_id not in found:
-                for kw in keywords:
-                    if kw.lower() in title_lower:
-                        found.append(saint_id)
-                        break
-    return found
+        # Every saint is already identified;
+        # the remaining titles cannot add any
+        if len(found) == len(saint_keywords):
+            break
+        matched = {saint_id
+                   for _, saint_ids in automaton.iter(work["title"].lower())
+                   for saint_id in saint_ids}
+        for saint_id in saint_keywords:
+            if saint_id in matched:
+                found[saint_id] = None
+    return list(found)
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# HTTP
+# ──────────────────────────────────────────────────────────────────────────────
+
+def _parse_retry_after(retry_after: str | None) -> float | None:
+    """
+    Return the delay a Retry-After header asks for (seconds or HTTP date),
+    or None if the header is missing or unreadable.
+    """
+    if not retry_after:
+        return None
+    if retry_after.isdigit():
+        return float(retry_after)
+    try:
+        when = email.utils.parsedate_to_datetime(retry_after)
+        return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return None
+
+
+def _retry_delay(attempt: int, retry_after: str | None) -> float | None:
+    """
+    Seconds to wait after failed attempt number 'attempt' (0-based).
+    Honors a Retry-After header; otherwise backs off exponentially. Either
+    way random jitter is added so parallel retries do not wake together.
+    Returns None if the server asks to wait longer than RETRY_AFTER_MAX.
+    """
+    jitter = random.uniform(0, RETRY_BACKOFF)
+    wait = _parse_retry_after(retry_after)
+    if wait is None:
+        return RETRY_BACKOFF * 2 ** attempt + jitter
+    if wait > RETRY_AFTER_MAX:
+        return None
+    return wait + jitter
+
+
+async def fetch_html(session: CachedSession, url: str) -> bytes:
+    """
+    GET url over the shared session and return the raw response body.
+    Statuses in RETRY_STATUSES and connection errors are retried up to
+    RETRY_TOTAL times; any other HTTP error, or a Retry-After longer than
+    RETRY_AFTER_MAX, raises ClientResponseError.
+    """
+    for attempt in range(RETRY_TOTAL + 1):
+        last_attempt = attempt == RETRY_TOTAL
+        try:
+            async with session.get(url) as resp:
+                delay = None
+                if resp.status in RETRY_STATUSES and not last_attempt:
+                    delay = _retry_delay(attempt, resp.headers.get("Retry-After"))
+                if delay is None:
+                    resp.raise_for_status()
+                    return await resp.read()
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+            if last_attempt:
+                raise
+            delay = _retry_delay(attempt, None)
+        await asyncio.sleep(delay)
 
 
 # ──────────────────────────────────────────────────────────────────────────────
 # MAIN SCRAPING FUNCTION
 # ──────────────────────────────────────────────────────────────────────────────
 
-def scrape_manuscript(project_id: int):
+async def fetch_manuscript(session: CachedSession,
+                           sem: asyncio.Semaphore,
+                           project_id: int):
     """
-    Fetch and parse one manuscript record from Jonas.
-    Returns a dict of metadata, or None on failure.
+    Fetch one manuscript page from Jonas.
+    The semaphore bounds how many fetches run at once; throttling beyond
+    that is left to the server's 429 / Retry-After responses.
+    Returns the raw page, or None on failure.
     """
     url = BASE_URL.format(project_id)
-    print(f"  → Fetching {url}")
 
+    async with sem:
+        print(f"  → Fetching {url}")
+        try:
+            html = await fetch_html(session, url)
+        except aiohttp.ClientResponseError as e:
+            print(f"    ✗ HTTP error for ID {project_id}: {e}", file=sys.stderr)
+            return None
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            print(f"    ✗ Network error for ID {project_id}: {e}", file=sys.stderr)
+            return None
+
+    return html
+
+
+def parse_manuscript(html: bytes, project_id: int):
+    """
+    Parse one manuscript page into its metadata record.
+    This is CPU-bound and self-contained, so it runs in a worker process.
+    Returns a dict of metadata, or None if the page is empty.
+    """
+    # ── Contents ─────────────────────────────────────────────────────────────
+    # Stream the page: works are parsed as their divs close, and the rest of
+    # the tree (everything outside the cleared work divs) is kept for the
+    # manuscript-level fields below. Jonas serves UTF-8.
+    context = etree.iterparse(io.BytesIO(html), events=("end",), tag="div",
+                              html=True, encoding="utf-8")
     try:
-        resp = requests.get(url, headers=HEADERS, timeout=30)
-        resp.raise_for_status()
-        resp.encoding = "utf-8"
-    except requests.exceptions.HTTPError as e:
-        print(f"    ✗ HTTP error for ID {project_id}: {e}", file=sys.stderr)
-        return None
-    except requests.exceptions.RequestException as e:
-        print(f"    ✗ Network error for ID {project_id}: {e}", file=sys.stderr)
+        contents = list(parse_contents(context))
+    except etree.XMLSyntaxError:
+        contents = []
+    tree = context.root
+    if tree is None:
         return None
 
-    soup = BeautifulSoup(resp.text, "lxml")
+    saints = identify_saints(contents, SAINT_KEYWORDS)
 
     # ── Core metadata ────────────────────────────────────────────────────────
-    shelfmark = parse_shelfmark(soup)
+    shelfmark = parse_shelfmark(tree)
+    index     = _build_field_index(tree)
 
     # Date field — Jonas uses "Datation détaillée" or just "Datation"
     date_str = (
-        get_field(soup, "Datation détaillée")
-        or get_field(soup, "Datation")
-        or get_field(soup, "Date")
+        get_field(index, "Datation détaillée")
+        or get_field(index, "Datation")
+        or get_field(index, "Date")
     )
 
     # Language
     language = (
-        get_field(soup, "Langue principale")
-        or get_field(soup, "Langue")
+        get_field(index, "Langue principale")
+        or get_field(index, "Langue")
     )
 
     # Support material
     support = (
-        get_field(soup, "Type support")
-        or get_field(soup, "Support")
+        get_field(index, "Type support")
+        or get_field(index, "Support")
     )
 
     # Physical dimensions
-    height_mm = get_field(soup, "Hauteur page")
-    width_mm  = get_field(soup, "Largeur page")
-    if height_mm and width_mm:
-        # Extract just the numeric part if there are trailing labels
-        h = re.search(r"\d+", height_mm)
-        w = re.search(r"\d+", width_mm)
-        dimensions = f"{h.group(0)} × {w.group(0)} mm" if h and w else ""
-    else:
-        dimensions = ""
+    dimensions = format_dimensions(
+        get_field(index, "Hauteur page"),
+        get_field(index, "Largeur page"),
+    )
 
     # Folios, columns, script, origin
-    folios  = get_field(soup, "Nombre de feuillets")
-    columns = get_field(soup, "Nombre de colonnes")
-    script  = get_field(soup, "Type d'écriture") or get_field(soup, "Écriture")
+    folios  = get_field(index, "Nombre de feuillets")
+    columns = get_field(index, "Nombre de colonnes")
+    script  = get_field(index, "Type d'écriture") or get_field(index, "Écriture")
     # "Origine géographique" is a section header; the actual value is under
     # "Localisation par la langue" (sub-label) → next sibling td = e.g. "Picardie"
     origin  = (
-        get_field(soup, "Localisation par la langue")
-        or get_field(soup, "Localisation")
-        or get_field(soup, "Origine géographique")
+        get_field(index, "Localisation par la langue")
+        or get_field(index, "Localisation")
+        or get_field(index, "Origine géographique")
     )
 
     # Provenance (ownership history, separate from geographic origin)
-    provenance = get_field(soup, "Possesseur") or get_field(soup, "Provenance ancienne")
-
-    # ── Contents ─────────────────────────────────────────────────────────────
-    contents = parse_contents(soup)
-    saints   = identify_saints(contents, SAINT_KEYWORDS)
+    provenance = get_field(index, "Possesseur") or get_field(index, "Provenance ancienne")
 
     # ── Short date (century only, e.g. "13e s") ──────────────────────────────
-    date_short_match = re.match(r"(\d+e\s*s\.?)", date_str)
+    date_short_match = _CENTURY_RE.match(date_str)
     date_short = date_short_match.group(1) if date_short_match else date_str[:12]
 
-    # ── Summary ──────────────────────────────────────────────────────────────
-    print(f"    ✓ {shelfmark or '(no shelfmark)'}")
-    print(f"      Date: {date_str or '—'}  |  Support: {support or '—'}  |"
-          f"  Origin: {origin or '—'}")
-    print(f"      Works found: {len(contents)}  |  Saints identified: {saints}")
-
     return {
         "jonas_id":          project_id,
-        "jonas_url":         url,
+        "jonas_url":         BASE_URL.format(project_id),
         "shelfmark":         shelfmark,
         "date":              date_str,
         "date_short":        date_short,
@@ -351,27 +577,71 @@ def scrape_manuscript(project_id: int):
     }
 
 
+async def scrape_manuscript(session: CachedSession,
+                            sem: asyncio.Semaphore,
+                            pool: ProcessPoolExecutor,
+                            project_id: int):
+    """
+    Fetch one manuscript record from Jonas and parse it in the process pool,
+    so pages parse on other cores while further fetches are in flight.
+    Returns a dict of metadata, or None on failure.
+    """
+    html = await fetch_manuscript(session, sem, project_id)
+    if html is None:
+        return None
+
+    loop = asyncio.get_running_loop()
+    ms = await loop.run_in_executor(pool, parse_manuscript, html, project_id)
+    if ms is None:
+        print(f"    ✗ Empty page for ID {project_id}", file=sys.stderr)
+        return None
+
+    # ── Summary ──────────────────────────────────────────────────────────────
+    print(f"    ✓ {ms['shelfmark'] or '(no shelfmark)'}")
+    print(f"      Date: {ms['date'] or '—'}  |  Support: {ms['support'] or '—'}  |"
+          f"  Origin: {ms['origin'] or '—'}")
+    print(f"      Works found: {len(ms['contents'])}  |  Saints identified: {ms['saints']}")
+
+    return ms
+
+
 # ──────────────────────────────────────────────────────────────────────────────
 # ENTRY POINT
 # ──────────────────────────────────────────────────────────────────────────────
 
+async def scrape_all(project_ids: list) -> list:
+    """
+    Fetch all manuscripts concurrently over one shared HTTP session, so
+    keep-alive connections to Jonas are pooled and reused across requests
+    and fresh pages already in the on-disk cache are not requested at all.
+    Parsing runs in a process pool sized to the CPU count, not the number
+    of manuscripts.
+    Returns the results in the same order as project_ids (None for failures).
+    """
+    sem = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    connector = aiohttp.TCPConnector(limit_per_host=MAX_CONNECTIONS_PER_HOST)
+    timeout = aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
+    cache = SQLiteBackend(CACHE_PATH, expire_after=CACHE_EXPIRE_AFTER)
+    # Workers start lazily, once the cache and resolver threads are running;
+    # forking a process with live threads can deadlock, so spawn them instead
+    spawn = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=os.cpu_count(), mp_context=spawn) as pool:
+        async with CachedSession(cache=cache, headers=HEADERS, connector=connector,
+                                 timeout=timeout) as session:
+            return await asyncio.gather(
+                *(scrape_manuscript(session, sem, pool, ms_id) for ms_id in project_ids)
+            )
+
+
 def main():
     print(f"Scraping {len(MANUSCRIPT_IDS)} manuscript(s) from Jonas IRHT-CNRS...")
     print(f"Output: {OUTPUT_PATH}\n")
 
-    results = []
-    for i, ms_id in enumerate(MANUSCRIPT_IDS):
-        ms = scrape_manuscript(ms_id)
-        if ms:
-            results.append(ms)
-        # Polite delay between requests (skip after last item)
-        if i < len(MANUSCRIPT_IDS) - 1:
-            time.sleep(DELAY_SECONDS)
+    results = [ms for ms in asyncio.run(scrape_all(MANUSCRIPT_IDS)) if ms]
 
-    # Write JSON
+    # Write JSON (orjson emits UTF-8 bytes, so non-ASCII text stays readable)
     OUTPUT_PATH.parent.mkdir(parents=True, exist_ok=True)
-    with open(OUTPUT_PATH, "w", encoding="utf-8") as f:
-        json.dump(results, f, ensure_ascii=False, indent=2)
+    OUTPUT_PATH.write_bytes(orjson.dumps(results, option=orjson.OPT_INDENT_2))
 
     print(f"\nDone. Wrote {len(results)} record(s) to {OUTPUT_PATH}")
     if len(results) < len(MANUSCRIPT_IDS):